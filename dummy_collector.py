@@ -11,41 +11,92 @@ This collector:
 """
 
 import argparse
+import concurrent.futures
+import fnmatch
+import itertools
 import json
 import glob
+import io
+import mmap
+import os
+import pickle
+import re
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional
 import statistics
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works everywhere
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional speedup, statistics fallback below
+    np = None
+
+try:
+    import numba
+except ImportError:  # optional speedup, NumPy/stdlib paths work without it
+    numba = None
+
+if np is not None and numba is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _agg_kernel(arr):
+        """Fused native reduction: (mean, max, min, sum) in one pass."""
+        total = 0.0
+        minimum = arr[0]
+        maximum = arr[0]
+        for v in arr:
+            total += v
+            if v < minimum:
+                minimum = v
+            elif v > maximum:
+                maximum = v
+        return total / arr.size, maximum, minimum, total
+
+else:
+    _agg_kernel = None
+
+# Pick the parser once at import time instead of per file.
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Compiled wildcard segments, shared across find_data_files calls so repeated
+# invocations skip the fnmatch.translate + re.compile work.
+_PATTERN_CACHE: Dict[str, re.Pattern] = {}
+
+
+def _segment_regex(seg: str) -> re.Pattern:
+    rx = _PATTERN_CACHE.get(seg)
+    if rx is None:
+        rx = _PATTERN_CACHE[seg] = re.compile(fnmatch.translate(seg))
+    return rx
+
 
 def parse_dynamic_args(argv):
     """Parse command line arguments with support for dynamic flags.
 
     Dynamic flags like --methods.result capture all arguments until the next flag.
     """
-    # First pass: group arguments by flags
+    # One pass: split argv into alternating runs of flags and values.
+    # Slicing is faster than str.startswith for a fixed two-char prefix.
     grouped_args = {}
     current_flag = None
-    i = 0
 
-    while i < len(argv):
-        arg = argv[i]
-
-        if arg.startswith("--"):
-            # New flag found
-            current_flag = arg
-            grouped_args[current_flag] = []
+    for is_flag, group in itertools.groupby(argv, key=lambda arg: arg[:2] == "--"):
+        if is_flag:
+            for flag in group:
+                current_flag = flag
+                grouped_args[current_flag] = []
         elif current_flag:
-            # Argument belongs to current flag
-            grouped_args[current_flag].append(arg)
+            # Arguments belong to the most recent flag
+            grouped_args[current_flag].extend(group)
         else:
-            # Positional argument (shouldn't happen with our usage)
-            if "__positional__" not in grouped_args:
-                grouped_args["__positional__"] = []
-            grouped_args["__positional__"].append(arg)
-
-        i += 1
+            # Positional arguments (shouldn't happen with our usage)
+            grouped_args.setdefault("__positional__", []).extend(group)
 
     return grouped_args
 
@@ -67,6 +118,7 @@ def parse_args():
     args.metric_key = "result"
     args.aggregation = "all"
     args.debug = False
+    args.include_details = False
     args.prefix = ""
     args.collector = None
     args.extra = []
@@ -91,6 +143,8 @@ def parse_args():
                 args.aggregation = values[0]
         elif flag == "--debug":
             args.debug = True  # Flag presence indicates True
+        elif flag == "--include-details":
+            args.include_details = True  # Emit per-file details in the output
         elif flag == "--prefix":
             args.prefix = values[0] if values else ""
         elif flag == "--collector":
@@ -110,27 +164,270 @@ def parse_args():
     return args
 
 
-def find_data_files(pattern: str, debug: bool = False) -> List[Path]:
-    """Find all data files using glob pattern."""
+def find_data_files(
+    pattern: str,
+    debug: bool = False,
+    dir_fds: Optional[Dict[str, int]] = None,
+) -> Iterator[str]:
+    """Yield data files matching a glob pattern, lazily, as plain strings.
+
+    When a dir_fds dict is passed, each directory that produces a match is
+    opened once and recorded as {dirpath: fd}, so the loader can open files
+    relative to the directory fd (one path component for the kernel to
+    resolve instead of the whole path). The caller owns the fds and must
+    close them when done.
+
+    Paths stay str throughout: Path construction does normalization work
+    that the hot loop never needs, and open() accepts strings directly.
+
+    Walks the tree with os.scandir() instead of glob.glob() so that file/dir
+    checks reuse the dirent type cached on each DirEntry (no extra stat per
+    entry). Literal pattern segments are joined as plain strings without
+    scanning, wildcard segments are matched with a pre-compiled regex, and
+    the walk uses an explicit stack rather than recursion. Matches are
+    yielded as they are found instead of collected into a list, so the
+    caller can start processing while the walk is still in progress.
+    """
     if debug:
         print(f"Searching for files with pattern: {pattern}")
 
-    files = []
-    for file_path in glob.glob(pattern, recursive=True):
-        path_obj = Path(file_path)
-        if path_obj.is_file():
-            files.append(path_obj)
+    # Short-circuit literal patterns: a single isfile check instead of a walk.
+    if not glob.has_magic(pattern):
+        if os.path.isfile(pattern):
             if debug:
-                print(f"Found data file: {file_path}")
+                print(f"Found data file: {pattern}")
+            yield pattern
+        return
+
+    segments = pattern.split(os.sep)
+
+    # Consume the literal prefix with plain string joins (no directory scans).
+    root = ""
+    start = 0
+    if segments and segments[0] == "":
+        root = os.sep
+        start = 1
+    while start < len(segments) - 1 and not glob.has_magic(segments[start]):
+        root = os.path.join(root, segments[start]) if root else segments[start]
+        start += 1
+
+    segs = segments[start:]
+    if not segs or segs == [""]:
+        return
+    last = len(segs) - 1
+
+    def register_dir_fd(dirpath: str) -> None:
+        if dir_fds is None or dirpath in dir_fds:
+            return
+        try:
+            dir_fds[dirpath] = os.open(
+                dirpath or ".", os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+            )
+        except OSError:
+            pass
+
+    stack = [(root, 0)]
+
+    while stack:
+        dirpath, idx = stack.pop()
+        seg = segs[idx]
+
+        if seg == "**":
+            # "**" matches zero or more directories: try the rest of the
+            # pattern here, and keep "**" active in every subdirectory.
+            if idx < last:
+                stack.append((dirpath, idx + 1))
+            try:
+                entries = os.scandir(dirpath or ".")
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    child = (
+                        os.path.join(dirpath, entry.name) if dirpath else entry.name
+                    )
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((child, idx))
+                    elif idx == last and entry.is_file():
+                        if debug:
+                            print(f"Found data file: {child}")
+                        register_dir_fd(dirpath)
+                        yield child
+            continue
+
+        if not glob.has_magic(seg):
+            # Literal segment: a single path check, no scan needed.
+            child = os.path.join(dirpath, seg) if dirpath else seg
+            if idx == last:
+                if os.path.isfile(child):
+                    if debug:
+                        print(f"Found data file: {child}")
+                    register_dir_fd(dirpath)
+                    yield child
+            elif os.path.isdir(child):
+                stack.append((child, idx + 1))
+            continue
+
+        rx = _segment_regex(seg)
+        try:
+            entries = os.scandir(dirpath or ".")
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(".") and not seg.startswith("."):
+                    continue
+                if not rx.match(name):
+                    continue
+                child = os.path.join(dirpath, name) if dirpath else name
+                if idx == last:
+                    if entry.is_file():
+                        if debug:
+                            print(f"Found data file: {child}")
+                        register_dir_fd(dirpath)
+                        yield child
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append((child, idx + 1))
+
+
+# Fast-path regexes for the flat data-file layout: pull out the error and
+# metric fields with substring matches instead of parsing the whole document.
+_ERROR_NULL_RE = re.compile(rb'"error"\s*:\s*null')
+_METRIC_RE_CACHE: Dict[str, re.Pattern] = {}
+
+
+def _metric_regex(metric_key: str) -> re.Pattern:
+    rx = _METRIC_RE_CACHE.get(metric_key)
+    if rx is None:
+        rx = _METRIC_RE_CACHE[metric_key] = re.compile(
+            rb'"' + re.escape(metric_key.encode()) + rb'"\s*:\s*(-?[0-9][0-9.eE+-]*)'
+        )
+    return rx
+
+
+# Files below this size are cheaper to re-parse than to memoize.
+_CACHE_MIN_SIZE = 4096
+_CACHE_FILENAME = ".cache.pkl"
+
+
+def load_cache(output_dir: Path) -> Dict:
+    """Load the persistent result cache, or an empty dict if absent/corrupt."""
+    try:
+        with open(output_dir / _CACHE_FILENAME, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        return {}
+
+
+def save_cache(output_dir: Path, cache: Dict) -> None:
+    """Persist the result cache next to the output; best-effort."""
+    try:
+        with open(output_dir / _CACHE_FILENAME, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def dump_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when available.
+
+    Pretty-printing walks every value to insert whitespace, so it is only
+    enabled for debug runs; pipelines get compact output.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
-    return files
 
+def _open_data_file(file_path: str, dir_fds: Optional[Dict[str, int]]):
+    """Open a data file, relative to a cached directory fd when available.
 
-def load_result_from_file(file_path: Path, metric_key: str, debug: bool = False) -> Any:
-    """Load a specific result from a JSON file, return 'NA' if error field is not None."""
+    Opening by bare filename with dir_fd makes the kernel resolve a single
+    path component instead of walking the whole path from cwd.
+    """
+    if dir_fds:
+        dirpath, _, name = file_path.rpartition(os.sep)
+        dfd = dir_fds.get(dirpath)
+        if dfd is not None:
+            return os.fdopen(os.open(name, os.O_RDONLY, dir_fd=dfd), "rb")
+    return open(file_path, "rb")
+
+
+def load_result_from_file(
+    file_path: str,
+    metric_key: str,
+    debug: bool = False,
+    cache: Optional[Dict] = None,
+    dir_fds: Optional[Dict[str, int]] = None,
+) -> Any:
+    """Load a specific result from a JSON file, return 'NA' if error field is not None.
+
+    When a cache dict is provided, results for files large enough to be worth
+    memoizing are keyed by (path, mtime_ns, metric_key), so unchanged files
+    are not re-parsed on incremental re-runs.
+    """
+    key = None
+    if cache is not None:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            st = None
+        if st is not None and st.st_size >= _CACHE_MIN_SIZE:
+            key = (file_path, st.st_mtime_ns, metric_key)
+            if key in cache:
+                if debug:
+                    print(f"Cache hit for {file_path}")
+                return cache[key]
+
+    value = _load_result_uncached(file_path, metric_key, debug, dir_fds)
+    if key is not None:
+        cache[key] = value
+    return value
+
+
+def _load_result_uncached(
+    file_path: str,
+    metric_key: str,
+    debug: bool = False,
+    dir_fds: Optional[Dict[str, int]] = None,
+) -> Any:
     try:
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        with _open_data_file(file_path, dir_fds) as f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files (and exotic filesystems) cannot be mapped.
+                buf = None
+
+            if buf is not None:
+                try:
+                    # Fast path: when the error field is null and the metric
+                    # is a plain number, extract it with two substring
+                    # matches and skip building the dict entirely. Anything
+                    # else falls through to the full parse below.
+                    if _ERROR_NULL_RE.search(buf):
+                        match = _metric_regex(metric_key).search(buf)
+                        if match:
+                            value = float(match.group(1))
+                            if debug:
+                                print(
+                                    f"Extracted {metric_key}={value} from {file_path}"
+                                )
+                            return value
+                    raw = buf[:]
+                finally:
+                    buf.close()
+            else:
+                raw = f.read()
+
+        # orjson parses raw bytes directly (no text decoding step) and is
+        # several times faster than json.load on these small documents.
+        data = _loads(raw)
 
         # Check if there's an error field
         if "error" in data and data["error"] is not None:
@@ -161,29 +458,71 @@ def load_result_from_file(file_path: Path, metric_key: str, debug: bool = False)
 
 
 def aggregate_results(
-    values: List[float], aggregation: str, debug: bool = False
+    values: List[float], aggregation: str, prefix: str = "", debug: bool = False
 ) -> Dict[str, Any]:
-    """Aggregate a list of numeric values."""
-    if not values:
-        return {"error": "No valid values found"}
+    """Aggregate a list of numeric values.
 
-    result = {}
+    Uses NumPy reductions (single C loops over a float64 array) when
+    available; otherwise falls back to the interpreted stdlib versions.
+    Keys are emitted already carrying the optional prefix, so the caller
+    never has to rewrite the dict afterwards.
+    """
+    key_prefix = f"{prefix}_" if prefix else ""
 
-    if aggregation == "all" or aggregation == "avg":
-        result["avg"] = statistics.mean(values)
+    if not values:
+        return {f"{key_prefix}error": "No valid values found"}
 
-    if aggregation == "all" or aggregation == "max":
-        result["max"] = max(values)
+    result = {}
 
-    if aggregation == "all" or aggregation == "min":
-        result["min"] = min(values)
+    if np is not None:
+        arr = np.asarray(values, dtype=np.float64)
 
-    if aggregation == "all" or aggregation == "sum":
-        result["sum"] = sum(values)
+        if aggregation == "all" and _agg_kernel is not None:
+            avg, maximum, minimum, total = _agg_kernel(arr)
+            result[f"{key_prefix}avg"] = float(avg)
+            result[f"{key_prefix}max"] = float(maximum)
+            result[f"{key_prefix}min"] = float(minimum)
+            result[f"{key_prefix}sum"] = float(total)
+        else:
+            if aggregation == "all" or aggregation == "avg":
+                result[f"{key_prefix}avg"] = float(arr.mean())
+
+            if aggregation == "all" or aggregation == "max":
+                result[f"{key_prefix}max"] = float(arr.max())
+
+            if aggregation == "all" or aggregation == "min":
+                result[f"{key_prefix}min"] = float(arr.min())
+
+            if aggregation == "all" or aggregation == "sum":
+                result[f"{key_prefix}sum"] = float(arr.sum())
+    elif aggregation == "all":
+        # Fused single pass: one traversal computes running sum/min/max
+        # instead of walking the list four times.
+        total = 0.0
+        minimum = maximum = values[0]
+        for v in values:
+            total += v
+            if v < minimum:
+                minimum = v
+            elif v > maximum:
+                maximum = v
+        result[f"{key_prefix}avg"] = total / len(values)
+        result[f"{key_prefix}max"] = maximum
+        result[f"{key_prefix}min"] = minimum
+        result[f"{key_prefix}sum"] = total
+    else:
+        if aggregation == "avg":
+            result[f"{key_prefix}avg"] = statistics.mean(values)
+        elif aggregation == "max":
+            result[f"{key_prefix}max"] = max(values)
+        elif aggregation == "min":
+            result[f"{key_prefix}min"] = min(values)
+        elif aggregation == "sum":
+            result[f"{key_prefix}sum"] = sum(values)
 
     # Always include count and metadata
-    result["count"] = len(values)
-    result["values"] = values
+    result[f"{key_prefix}count"] = len(values)
+    result[f"{key_prefix}values"] = values
 
     if debug:
         print(f"Aggregated {len(values)} values: {result}")
@@ -195,38 +534,37 @@ def save_cli_debug(args: argparse.Namespace, output_dir: Path):
     """Save CLI arguments to cli.txt for debugging (like dummymodule)."""
     cli_file = output_dir / "cli.txt"
 
-    cli_content = [
-        "=== DUMMY COLLECTOR CLI DEBUG ===",
-        f"Script: {sys.argv[0]}",
-        f"Arguments: {' '.join(sys.argv[1:])}",
-        "",
-        "=== PARSED ARGUMENTS ===",
-    ]
-
-    # Add known arguments
-    for key, value in vars(args).items():
-        if key != "dynamic_args":
-            cli_content.append(f"{key}: {value}")
+    # Known arguments
+    known = "\n".join(
+        f"{key}: {value}" for key, value in vars(args).items() if key != "dynamic_args"
+    )
 
-    # Add dynamic arguments
+    # Dynamic arguments
+    dynamic = ""
     if hasattr(args, "dynamic_args") and args.dynamic_args:
-        cli_content.append("")
-        cli_content.append("=== DYNAMIC ARGUMENTS ===")
-        for flag, values in args.dynamic_args.items():
-            cli_content.append(f"{flag}: {values}")
-
-    cli_content.extend(
-        [
-            "",
-            "=== ENVIRONMENT ===",
-            f"Python: {sys.version}",
-            f"Working directory: {Path.cwd()}",
-            f"Output directory: {output_dir.absolute()}",
-        ]
+        dynamic_lines = "\n".join(
+            f"{flag}: {values}" for flag, values in args.dynamic_args.items()
+        )
+        dynamic = f"\n\n=== DYNAMIC ARGUMENTS ===\n{dynamic_lines}"
+
+    # One template, one write: no intermediate list or per-line appends.
+    content = (
+        "=== DUMMY COLLECTOR CLI DEBUG ===\n"
+        f"Script: {sys.argv[0]}\n"
+        f"Arguments: {' '.join(sys.argv[1:])}\n"
+        "\n"
+        "=== PARSED ARGUMENTS ===\n"
+        f"{known}"
+        f"{dynamic}"
+        "\n"
+        "\n"
+        "=== ENVIRONMENT ===\n"
+        f"Python: {sys.version}\n"
+        f"Working directory: {Path.cwd()}\n"
+        f"Output directory: {output_dir.absolute()}"
     )
 
-    with open(cli_file, "w") as f:
-        f.write("\n".join(cli_content))
+    cli_file.write_text(content, encoding="utf-8")
 
     print(f"CLI debug info saved to: {cli_file}")
 
@@ -249,15 +587,18 @@ def main():
         print(f"Metric key: {args.metric_key}")
         print(f"Aggregation: {args.aggregation}")
 
+    dir_fds: Dict[str, int] = {}
+
     # Check if --methods.result was provided with file paths
     if hasattr(args, "dynamic_args") and "--methods.result" in args.dynamic_args:
         # Use files from --methods.result
         method_result_files = args.dynamic_args["--methods.result"]
         data_files = []
         for file_path in method_result_files:
-            path_obj = Path(file_path)
-            if path_obj.exists() and path_obj.is_file():
-                data_files.append(path_obj)
+            # isfile() already returns False for missing paths; a separate
+            # exists() check would just stat the same path twice.
+            if os.path.isfile(file_path):
+                data_files.append(file_path)
                 if args.debug:
                     print(f"Using file from --methods.result: {file_path}")
             elif args.debug:
@@ -268,12 +609,20 @@ def main():
                 f"Using {len(data_files)} files from --methods.result instead of glob pattern"
             )
     else:
-        # Fall back to glob pattern search
+        # Fall back to glob pattern search; the walker records one open fd
+        # per matched directory so files can be opened relative to it.
         if args.debug:
             print("No --methods.result provided, using glob pattern search")
-        data_files = find_data_files(args.input_pattern, args.debug)
+        data_files = find_data_files(args.input_pattern, args.debug, dir_fds)
+
+    # Peek the first match so the "no files found" branch works without
+    # materializing the whole stream.
+    data_files = iter(data_files)
+    first_file = next(data_files, None)
+    if first_file is not None:
+        data_files = itertools.chain([first_file], data_files)
 
-    if not data_files:
+    if first_file is None:
         if hasattr(args, "dynamic_args") and "--methods.result" in args.dynamic_args:
             error_result = {
                 "error": f"No valid files found in --methods.result",
@@ -289,74 +638,104 @@ def main():
 
         # Still save the error result
         output_file = output_dir / "metrics.json"
-        with open(output_file, "w") as f:
-            json.dump(error_result, f, indent=2)
+        with open(output_file, "wb", buffering=io.DEFAULT_BUFFER_SIZE) as f:
+            f.write(dump_json(error_result, indent=args.debug))
 
         print(f"No data files found. Error result saved to: {output_file}")
         return 1
 
-    # Extract result values from all files
+    # Extract result values from all files. The reads are IO-bound (many
+    # small open/read/parse cycles), so a thread pool overlaps the disk
+    # latency across files; executor.map preserves input order.
+    # Per-file details are only collected when requested: for large runs the
+    # details list dominates both memory and output size.
     values = []
     file_info = []
+    files_processed = 0
 
-    for file_path in data_files:
-        value = load_result_from_file(file_path, args.metric_key, args.debug)
-        if value != "NA":
-            try:
-                # Convert to float for aggregation
-                numeric_value = float(value)
-                values.append(numeric_value)
-                file_info.append({"file": str(file_path), "value": numeric_value})
-            except (ValueError, TypeError):
-                if args.debug:
-                    print(f"Skipping non-numeric value {value} from {file_path}")
-                file_info.append(
-                    {"file": str(file_path), "value": "NA", "error": "non-numeric"}
-                )
-        else:
-            file_info.append({"file": str(file_path), "value": "NA"})
+    # Compile the metric regex once up front so the workers only hit the cache.
+    _metric_regex(args.metric_key)
 
-    # Perform aggregation
-    aggregated = aggregate_results(values, args.aggregation, args.debug)
+    # Persistent memoization across runs: unchanged files hit the cache.
+    cache = load_cache(output_dir)
+    cache_size = len(cache)
 
-    # Add metadata
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            loaded = executor.map(
+                lambda p: (
+                    p,
+                    load_result_from_file(
+                        p, args.metric_key, args.debug, cache, dir_fds
+                    ),
+                ),
+                data_files,
+            )
+
+            for file_path, value in loaded:
+                files_processed += 1
+                if value != "NA":
+                    try:
+                        # Convert to float for aggregation
+                        numeric_value = float(value)
+                        values.append(numeric_value)
+                        if args.include_details:
+                            file_info.append(
+                                {"file": file_path, "value": numeric_value}
+                            )
+                    except (ValueError, TypeError):
+                        if args.debug:
+                            print(f"Skipping non-numeric value {value} from {file_path}")
+                        if args.include_details:
+                            file_info.append(
+                                {
+                                    "file": file_path,
+                                    "value": "NA",
+                                    "error": "non-numeric",
+                                }
+                            )
+                elif args.include_details:
+                    file_info.append({"file": file_path, "value": "NA"})
+    finally:
+        for fd in dir_fds.values():
+            os.close(fd)
+
+    if len(cache) != cache_size:
+        save_cache(output_dir, cache)
+
+    # Perform aggregation; keys come back already prefixed, so no dict
+    # rewrite is needed afterwards.
+    aggregated = aggregate_results(
+        values, args.aggregation, prefix=args.prefix, debug=args.debug
+    )
+
+    # Add metadata (metric_key, aggregation_type, files_details and
+    # input_pattern are never prefixed)
+    key_prefix = f"{args.prefix}_" if args.prefix else ""
     result = {
         "aggregation_type": args.aggregation,
         "metric_key": args.metric_key,
-        "files_processed": len(file_info),
-        "files_details": file_info,
-        **aggregated,
+        f"{key_prefix}files_processed": files_processed,
     }
+    if args.include_details:
+        result["files_details"] = file_info
+    result.update(aggregated)
 
     # Add source information
     if hasattr(args, "dynamic_args") and "--methods.result" in args.dynamic_args:
-        result["source"] = "methods.result"
-        result["files_specified"] = args.dynamic_args["--methods.result"]
+        result[f"{key_prefix}source"] = "methods.result"
+        result[f"{key_prefix}files_specified"] = args.dynamic_args["--methods.result"]
     else:
-        result["source"] = "glob_pattern"
+        result[f"{key_prefix}source"] = "glob_pattern"
         result["input_pattern"] = args.input_pattern
 
-    # Add prefix if specified
-    if args.prefix:
-        prefixed_result = {}
-        for key, value in result.items():
-            if key not in [
-                "files_details",
-                "input_pattern",
-                "metric_key",
-                "aggregation_type",
-            ]:
-                prefixed_result[f"{args.prefix}_{key}"] = value
-            else:
-                prefixed_result[key] = value
-        result = prefixed_result
-
     # Save aggregated metrics
     output_file = output_dir / "metrics.json"
-    with open(output_file, "w") as f:
-        json.dump(result, f, indent=2)
+    with open(output_file, "wb", buffering=io.DEFAULT_BUFFER_SIZE) as f:
+        f.write(dump_json(result, indent=args.debug))
 
-    print(f"Aggregated results from {len(file_info)} files saved to: {output_file}")
+    print(f"Aggregated results from {files_processed} files saved to: {output_file}")
 
     if args.debug:
         print("=== AGGREGATION RESULT ===")
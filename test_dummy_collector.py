@@ -223,6 +223,49 @@ def test_with_parameters():
         print("✅ Parameter test passed!")
 
 
+def test_include_details():
+    """Test that per-file details are only emitted when requested."""
+
+    collector_script = Path(__file__).parent / "dummy_collector.py"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        input_dir = tmp_path / "input"
+        output_dir = tmp_path / "output"
+
+        create_sample_data_files(input_dir)
+
+        # Default run: no files_details in the output
+        result = run_collector_test(collector_script, input_dir, output_dir)
+        assert result.returncode == 0, f"Collector failed: {result.returncode}"
+
+        with open(output_dir / "metrics.json", "r") as f:
+            metrics = json.load(f)
+
+        assert "files_details" not in metrics, (
+            "files_details should be omitted by default"
+        )
+        assert metrics["files_processed"] == 6, (
+            f"Expected 6 files processed, got {metrics['files_processed']}"
+        )
+
+        # Opt-in run: files_details present with one entry per file
+        result = run_collector_test(
+            collector_script, input_dir, output_dir, include_details=True
+        )
+        assert result.returncode == 0, f"Collector failed: {result.returncode}"
+
+        with open(output_dir / "metrics.json", "r") as f:
+            metrics = json.load(f)
+
+        assert "files_details" in metrics, "files_details not found in output"
+        assert len(metrics["files_details"]) == 6, (
+            f"Expected 6 detail entries, got {len(metrics['files_details'])}"
+        )
+
+        print("✅ Include details test passed!")
+
+
 def test_no_files_found():
     """Test collector behavior when no files are found."""
 
@@ -318,10 +361,13 @@ def main():
         print("\n--- Test 2: Parameter Handling ---")
         test_with_parameters()
 
-        print("\n--- Test 3: No Files Found ---")
+        print("\n--- Test 3: Include Details ---")
+        test_include_details()
+
+        print("\n--- Test 4: No Files Found ---")
         test_no_files_found()
 
-        print("\n--- Test 4: Error Handling ---")
+        print("\n--- Test 5: Error Handling ---")
         test_error_handling()
 
         print("\n🎉 All tests passed!")